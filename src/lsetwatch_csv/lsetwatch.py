@@ -1,16 +1,17 @@
 import codecs
-import collections
 import csv
 import dataclasses
+import io
 import locale
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from datetime import date, datetime, timezone
 from enum import IntEnum
+from itertools import chain
 from typing import Annotated, Optional
 
-from dataclass_csv import DataclassReader, DataclassWriter, dateformat
-
 DEFAULT_LSET_DATE_FORMAT = "%d/%m/%Y"
 DEFAULT_LSET_LOCALE = (
     locale.getlocale()
@@ -42,23 +43,34 @@ def format_numeric(val: float, loc=locale.getlocale()) -> str:
 
 
 # Custom encodings
+# The translation table and decode pattern are precompiled at module load to
+# keep the per-string cost of encode/decode down; both run once per string
+# field per row.
+_BELL_TRANS = str.maketrans({";": "\a59", '"': "\a34", "|": "\a124"})
+_DEC_RE = re.compile(r"\a(\d{1,3})")
+_DEC_RE_BYTES = re.compile(rb"\a(\d{1,3})")
+
+
 class BellEscapedAsciiStringCodec(codecs.Codec):
     # str encoding: bell-escaped ascii characters
-    ascii_chars_decode = re.compile(r"(\a)(\d{1,3})")
-    ascii_chars_encode = re.compile(r'[;"|]')
     name = LSET_STRING_ENCODING
 
     def encode(self, input: str, errors="strict") -> str:
-        encoded_string = re.sub(
-            self.ascii_chars_encode, lambda m: f"\a{ord(m.group(0))}", input
-        )
-        return (encoded_string, len(input))
+        return (input.translate(_BELL_TRANS), len(input))
 
     def decode(self, input: str, errors="strict") -> str:
-        decoded_string = re.sub(
-            self.ascii_chars_decode, lambda m: chr(int(m.group(2))), input
-        )
-        return (decoded_string, len(input))
+        if input.isascii():
+            # regex over bytes skips CPython's wide-character dispatch; the
+            # escapes name ASCII characters, so latin-1 covers the round-trip
+            try:
+                decoded = _DEC_RE_BYTES.sub(
+                    lambda m: bytes([int(m.group(1))]), input.encode("ascii")
+                ).decode("latin-1")
+                return (decoded, len(input))
+            except ValueError:
+                # escape value beyond the byte range, e.g. \a300
+                pass
+        return (_DEC_RE.sub(lambda m: chr(int(m.group(1))), input), len(input))
 
 
 class PipeSeparatedListCodec(codecs.Codec):
@@ -89,30 +101,114 @@ class LsetWatchDialect(csv.Dialect):
 
 
 # Custom field types
-class UnixTimestampString(int):
-    def __new__(cls, val: str):
-        return datetime.fromtimestamp(int(val), timezone.utc)
+class UnixTimestampString(datetime):
+    """
+    Timestamp parsed from a unix epoch string. Keeps the raw epoch value in
+    `unix` so writing the row back out does not pay datetime.timestamp().
+    """
+
+    unix: int | None = None
+
+    def __new__(cls, val, *args, **kwargs):
+        if args or kwargs:
+            # datetime's own constructors (fromtimestamp, pickling, ...)
+            # call back into the class with the component fields
+            return super().__new__(cls, val, *args, **kwargs)
+        self = cls.fromtimestamp(int(val), timezone.utc)
+        self.unix = int(val)
+        return self
 
 
 class BellEscapedAsciiString(str):
     def __new__(cls, string):
-        return super().__new__(cls, codecs.decode(string, LSET_STRING_ENCODING))
+        return super().__new__(cls, _BELL_DECODE(string)[0])
+
+    def __str__(self):
+        return _BELL_ENCODE(self)[0]
+
+
+class LazyBellEscapedAsciiString:
+    """
+    Bell-escaped string that defers decoding until first access. Most callers
+    only touch a handful of fields per row, so eagerly decoding every string
+    field of every row is wasted work. Compares equal to the decoded value;
+    str() returns the encoded form, like BellEscapedAsciiString.
+    """
+
+    __slots__ = ("raw", "_decoded")
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self._decoded = None
+
+    @property
+    def decoded(self) -> str:
+        if self._decoded is None:
+            self._decoded = _BELL_DECODE(self.raw)[0]
+        return self._decoded
+
+    def __str__(self):
+        return self.raw
+
+    def __repr__(self):
+        return repr(self.decoded)
+
+    def __eq__(self, other):
+        return self.decoded == other
+
+    def __hash__(self):
+        return hash(self.decoded)
+
+
+class LazyPipeSeparatedList:
+    """
+    Pipe-separated list that defers splitting until first access. Compares
+    equal to the split list; str() returns the joined form, like
+    PipeSeparatedList.
+    """
+
+    __slots__ = ("raw", "_data")
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self._data = None
+
+    @property
+    def data(self) -> list[str]:
+        if self._data is None:
+            self._data = self.raw.split("|")
+        return self._data
 
     def __str__(self):
-        return codecs.encode(self, LSET_STRING_ENCODING)
+        return self.raw
+
+    def __repr__(self):
+        return repr(self.data)
+
+    def __eq__(self, other):
+        return self.data == other
 
+    def __iter__(self):
+        return iter(self.data)
 
-class PipeSeparatedList(collections.UserList[str]):
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+
+class PipeSeparatedList(list[str]):
+    # subclasses list directly: UserList routes every element access through
+    # a Python-level delegation to self.data, doubling the attribute lookups
     def __init__(self, input: str | list | None = None):
-        data = (
-            codecs.decode(input, LSET_LIST_ENCODING)
-            if isinstance(input, str)
-            else input
-        )
+        # Split directly rather than via codecs.decode; the registry lookup is
+        # measurable overhead when constructing one list per field per row.
+        data = input.split("|") if isinstance(input, str) else input or ()
         super().__init__(data)
 
     def __str__(self):
-        return codecs.encode(self, LSET_LIST_ENCODING)
+        return _PSV_ENCODE(self)[0]
 
 
 # Model classes
@@ -193,7 +289,7 @@ class LsetCashbackType(IntEnum):
     PAYBACK = 2  # In Payback-Punkten
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class LsetwatchRow:
     """
     Lsetwatch CSV format, documented here: http://lebostein.de/lsetwatch/faq_de.html#IEM
@@ -282,97 +378,367 @@ class LsetwatchRow:
     altern_pieces: Optional[int] = None  # Teilezahl ueberschreiben?
 
 
+# Field groups shared by the readers
+_ENUM_FIELDS = {
+    "template": LsetTemplate,
+    "state": LsetStatus,
+    "purc_condition": LsetPurchaseStatus,
+    "sell_condition": LsetPurchaseStatus,
+    "cashback_type": LsetCashbackType,
+    "completeness": LsetInventoryStatus,
+    "packaging": LsetAccessoryStatus,
+    "instructions": LsetAccessoryStatus,
+}
+# value-indexed member tables, built once per enum; indexing a tuple replaces
+# the pure-Python EnumMeta call for every enum field of every row. All
+# Lsetwatch enums number their members contiguously from 0.
+_ENUM_VALUE_TABLES = {enum: tuple(enum) for enum in set(_ENUM_FIELDS.values())}
+_DATE_FIELDS = ["purc_date", "sell_date", "reminder_date"]
+_DECIMAL_FIELDS = [
+    "purc_price",
+    "purc_shipc",
+    "purc_costs",
+    "sell_price",
+    "sell_shipc",
+    "sell_costs",
+    "vip_points_get",
+    "vip_points_sub",
+    "cashback",
+    "sales_value",
+]
+
+
+def _optional_str(val):
+    return val if val else None
+
+
+# the documented format uses 0/1, but exports written with DataclassWriter
+# serialized booleans as "True"/"False"
+_BOOL_VALUES = {"0": False, "1": True, "False": False, "True": True}
+
+
+def _parse_bool(val):
+    if not val:
+        return None
+    try:
+        return _BOOL_VALUES[val]
+    except KeyError:
+        return bool(int(val))
+
+
+# Per-field parsers that do not depend on reader options, compiled once at
+# module load; _row_converters only binds the date-format and locale parsers.
+_STATIC_CONVERTERS = {
+    "last_edit": UnixTimestampString,
+    "marker": lambda v: int(v) if v else 0,
+    "purc_items": lambda v: int(v) if v else 1,
+    "sell_items": lambda v: int(v) if v else 1,
+    "altern_pieces": lambda v: int(v) if v else None,
+    "to_sell": _parse_bool,
+    "mygroup": lambda v: LazyBellEscapedAsciiString(v) if v else None,
+    "notes": lambda v: LazyBellEscapedAsciiString(v) if v else None,
+    "mytags": lambda v: LazyPipeSeparatedList(v) if v else [],
+    "documents": lambda v: LazyPipeSeparatedList(v) if v else [],
+}
+
+
+def _enum_converter(field: str, enum: type[IntEnum]):
+    members = _ENUM_VALUE_TABLES[enum]
+    default = LsetwatchRow.__dataclass_fields__[field].default
+
+    def convert(val):
+        if not val:
+            return default
+        index = int(val)
+        if 0 <= index < len(members):
+            return members[index]
+        # guard against Python's negative indexing mapping e.g. -1 to the
+        # last member; EnumMeta raises a descriptive ValueError instead
+        return enum(index)
+
+    return convert
+
+
+for field, enum in _ENUM_FIELDS.items():
+    _STATIC_CONVERTERS[field] = _enum_converter(field, enum)
+for field in dataclasses.fields(LsetwatchRow):
+    _STATIC_CONVERTERS.setdefault(field.name, _optional_str)
+
+
+def _row_converters(date_format: str, loc: str) -> dict:
+    """
+    Per-field converters from raw CSV strings to LsetwatchRow field values.
+    An empty field yields the dataclass default, matching csv_reader.
+    """
+
+    def parse_date(val):
+        return datetime.strptime(val, date_format).date() if val else None
+
+    def parse_decimal(val):
+        return parse_numeric(val, loc) if val else None
+
+    converters = dict(_STATIC_CONVERTERS)
+    for field in _DATE_FIELDS:
+        converters[field] = parse_date
+    for field in _DECIMAL_FIELDS:
+        converters[field] = parse_decimal
+    return converters
+
+
+def _buffered(csvfile):
+    """
+    Wrap raw byte streams in a large read buffer; reading row-by-row from an
+    unbuffered file pays one syscall per read otherwise. Text-mode and
+    in-memory inputs pass through untouched.
+    """
+    if isinstance(csvfile, io.RawIOBase):
+        buffered = io.BufferedReader(csvfile, buffer_size=1 << 20)
+        # explicit encoding: Lsetwatch exports are UTF-8 regardless of the
+        # locale's preferred encoding
+        return io.TextIOWrapper(buffered, encoding="utf-8", newline="")
+    return csvfile
+
+
+def _tokenize(buf: str):
+    """
+    Tokenize a whole Lsetwatch CSV buffer in one pass. The dialect has no
+    quoting or escaping, so rows and fields split on fixed separators and
+    both splits run as single C-level scans instead of the csv module's
+    character-by-character state machine.
+    """
+    return (line.split(";") for line in buf.splitlines() if line)
+
+
 def csv_reader(csvfile, **kwargs):
     loc = kwargs.pop("locale", DEFAULT_LSET_LOCALE)
     date_format = kwargs.pop("date_format", DEFAULT_LSET_DATE_FORMAT)
 
-    reader = DataclassReader(
-        csvfile, dateformat(date_format)(LsetwatchRow), dialect=LSET_CSV_DIALECT
-    )
+    csvfile = _buffered(csvfile)
+    converters = _row_converters(date_format, loc)
+
+    def read_rows():
+        rows = _tokenize(csvfile.read())
+        header = next(rows, None)
+        if header is None:
+            return
+        # resolve field name and converter per column once, not per row
+        columns = [(name, converters[name]) for name in header]
+        for row in rows:
+            yield LsetwatchRow(
+                **{name: convert(val) for (name, convert), val in zip(columns, row)}
+            )
+
+    return read_rows()
+
+
+def _decode_chunk(args):
+    # module-level so it pickles for the worker processes
+    header, lines, date_format, loc = args
+    converters = _row_converters(date_format, loc)
+    columns = [(name, converters[name]) for name in header]
+    return [
+        LsetwatchRow(
+            **{
+                name: convert(val)
+                for (name, convert), val in zip(columns, line.split(";"))
+            }
+        )
+        for line in lines
+    ]
 
-    # pipe-separated string lists
-    for field in ["mytags", "documents"]:
-        # TODO: string encoding within lists
-        pass
-
-    # int enums
-    for field in [
-        "template",
-        "state",
-        "purc_condition",
-        "sell_condition",
-        "cashback_type",
-        "completeness",
-        "packaging",
-        "instructions",
-    ]:
-        reader.type_hints[field] = int
-
-    # locale support for decimal values
-    for field in [
-        "purc_price",
-        "purc_shipc",
-        "purc_costs",
-        "sell_price",
-        "sell_shipc",
-        "sell_costs",
-        "vip_points_get",
-        "vip_points_sub",
-        "cashback",
-        "sales_value",
-    ]:
-        reader.type_hints[field] = lambda v: parse_numeric(v, loc)
-
-    return reader
 
+def csv_reader_parallel(path, workers: int | None = None, **kwargs):
+    """
+    Read a Lsetwatch CSV file with row decoding spread across a process pool.
+    Splits the file at row boundaries and decodes each chunk independently;
+    worth it for very large exports where per-row decoding dominates.
+    """
+    loc = kwargs.pop("locale", DEFAULT_LSET_LOCALE)
+    date_format = kwargs.pop("date_format", DEFAULT_LSET_DATE_FORMAT)
+    workers = workers or os.cpu_count() or 1
+
+    with open(path, encoding="utf-8", newline="") as file:
+        lines = [line for line in file.read().splitlines() if line]
+    if not lines:
+        return []
+    header, rows = lines[0].split(";"), lines[1:]
+    if not rows:
+        # header-only export; nothing to spread across workers
+        return []
+
+    chunk_size = -(-len(rows) // workers)  # ceiling division
+    chunks = [
+        (header, rows[i : i + chunk_size], date_format, loc)
+        for i in range(0, len(rows), chunk_size)
+    ]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        return list(chain.from_iterable(pool.map(_decode_chunk, chunks)))
+
+
+def csv_reader_fast(csvfile, **kwargs):
+    """
+    Bulk-read a Lsetwatch CSV file with pyarrow's CSV reader and column-wise
+    post-processing. Accepts a file path or binary file object and returns a
+    list of LsetwatchRow. Requires the optional pyarrow dependency.
+    """
+    import pyarrow
+    import pyarrow.csv
 
-def csv_writer(csvfile, data, **kwargs):
     loc = kwargs.pop("locale", DEFAULT_LSET_LOCALE)
     date_format = kwargs.pop("date_format", DEFAULT_LSET_DATE_FORMAT)
 
-    def encode_string(string: str | None) -> str | None:
-        return (
-            codecs.encode(string, LSET_STRING_ENCODING) if string is not None else None
-        )
+    # Read every column as string; Lsetwatch's locale-dependent decimals,
+    # date formats and escape sequences rule out Arrow's type inference.
+    column_types = {f.name: pyarrow.string() for f in dataclasses.fields(LsetwatchRow)}
+    table = pyarrow.csv.read_csv(
+        csvfile,
+        parse_options=pyarrow.csv.ParseOptions(
+            delimiter=";", quote_char=False, escape_char=False
+        ),
+        convert_options=pyarrow.csv.ConvertOptions(column_types=column_types),
+    )
 
-    def encode_list(list: list | None) -> list | None:
-        return codecs.encode(list, LSET_LIST_ENCODING) if list is not None else None
-
-    def encode_date(date: date | None) -> str | None:
-        return date.strftime(date_format) if date is not None else None
-
-    def encode_number(number: float | None) -> str | None:
-        return format_numeric(number, loc) if number is not None else None
-
-    def encode_item(item: LsetwatchRow) -> LsetwatchRow:
-        return dataclasses.replace(
-            item,
-            last_edit=int(datetime.timestamp(item.last_edit)),
-            mygroup=encode_string(item.mygroup),
-            notes=encode_string(item.notes),
-            mytags=encode_list(item.mytags),
-            documents=encode_list(item.documents),
-            purc_date=encode_date(item.purc_date),
-            sell_date=encode_date(item.sell_date),
-            reminder_date=encode_date(item.reminder_date),
-            purc_price=encode_number(item.purc_price),
-            purc_shipc=encode_number(item.purc_shipc),
-            purc_costs=encode_number(item.purc_costs),
-            sell_price=encode_number(item.sell_price),
-            sell_shipc=encode_number(item.sell_shipc),
-            sell_costs=encode_number(item.sell_costs),
-            vip_points_get=encode_number(item.vip_points_get),
-            vip_points_sub=encode_number(item.vip_points_sub),
-            cashback=encode_number(item.cashback),
-            sales_value=encode_number(item.sales_value),
-        )
+    converters = _row_converters(date_format, loc)
+    columns = [
+        list(map(converters[name], column.to_pylist()))
+        for name, column in zip(table.column_names, table.columns)
+    ]
+    names = table.column_names
+    return [LsetwatchRow(**dict(zip(names, row))) for row in zip(*columns)]
+
+
+# Specialized row encoder, generated at module load. Inlining the field
+# encodings as straight-line code avoids per-row reflection over the ~45
+# dataclass fields; the encoder emits one CSV cell string per field, in
+# dataclass field order.
+_FIELD_NAMES = tuple(f.name for f in dataclasses.fields(LsetwatchRow))
+
+
+def _encode_last_edit(timestamp: datetime) -> int:
+    # reader-produced timestamps carry the raw epoch value already
+    unix = getattr(timestamp, "unix", None)
+    return unix if unix is not None else int(datetime.timestamp(timestamp))
+
+
+def _encode_string_cell(val) -> str:
+    if val is None:
+        return ""
+    if type(val) is LazyBellEscapedAsciiString:
+        # never decoded, or already in encoded form
+        return val.raw
+    return val.translate(_BELL_TRANS)
+
+
+def _encode_list_cell(val) -> str:
+    if val is None:
+        return ""
+    if type(val) is LazyPipeSeparatedList:
+        return val.raw
+    return "|".join(val)
+
+
+_ENCODE_EXPRS = {
+    "last_edit": "str(_encode_last_edit(item.last_edit))",
+    # documented as 0 = Nein, 1 = Ja
+    "to_sell": '"" if item.to_sell is None else str(int(item.to_sell))',
+}
+for field in ["mygroup", "notes"]:
+    _ENCODE_EXPRS[field] = f"_encode_string_cell(item.{field})"
+for field in ["mytags", "documents"]:
+    _ENCODE_EXPRS[field] = f"_encode_list_cell(item.{field})"
+for field in ["purc_date", "sell_date", "reminder_date"]:
+    _ENCODE_EXPRS[field] = f'fmt_date(item.{field}) if item.{field} is not None else ""'
+for field in [
+    "purc_price",
+    "purc_shipc",
+    "purc_costs",
+    "sell_price",
+    "sell_shipc",
+    "sell_costs",
+    "vip_points_get",
+    "vip_points_sub",
+    "cashback",
+    "sales_value",
+]:
+    _ENCODE_EXPRS[field] = (
+        f'format_numeric(item.{field}, loc) if item.{field} is not None else ""'
+    )
 
-    encoded_data = [encode_item(i) for i in data]
 
-    writer = DataclassWriter(
-        csvfile, encoded_data, LsetwatchRow, dialect=LSET_CSV_DIALECT
+def _compile_row_encoder():
+    """Generate a factory for row encoders with the field encodings inlined."""
+    cells = ", ".join(
+        _ENCODE_EXPRS.get(name, f'"" if item.{name} is None else str(item.{name})')
+        for name in _FIELD_NAMES
+    )
+    src = (
+        "def make_row_encoder(fmt_date, loc):\n"
+        "    def encode_row(item):\n"
+        f"        return ({cells})\n"
+        "    return encode_row\n"
     )
-    return writer
+    namespace = {
+        "format_numeric": format_numeric,
+        "_encode_last_edit": _encode_last_edit,
+        "_encode_string_cell": _encode_string_cell,
+        "_encode_list_cell": _encode_list_cell,
+    }
+    exec(compile(src, "<encode_row>", "exec"), namespace)
+    return namespace["make_row_encoder"]
+
+
+_make_row_encoder = _compile_row_encoder()
+
+
+def _format_date_default(date: date) -> str:
+    # hand-rolled %d/%m/%Y; strftime re-parses the format string and takes a
+    # locale-aware C library path on every call
+    return f"{date.day:02d}/{date.month:02d}/{date.year:04d}"
+
+
+class LsetwatchWriter:
+    """
+    Batched CSV writer for encoded rows. The Lsetwatch dialect uses QUOTE_NONE
+    without an escape character, so a row serializes as a plain join and the
+    whole export is built in memory and written with a single write call,
+    instead of one csv.writer.writerow transition per row.
+    """
+
+    def __init__(self, csvfile, data, encode_row):
+        self.csvfile = csvfile
+        self.data = data
+        self.encode_row = encode_row
+
+    def write(self, skip_header: bool = False):
+        encode_row = self.encode_row
+        separators = len(_FIELD_NAMES) - 1
+        lines = [] if skip_header else [";".join(_FIELD_NAMES)]
+        for item in self.data:
+            line = ";".join(encode_row(item))
+            # a delimiter or line break in a non-escaped field would shift
+            # every following column; QUOTE_NONE has no way to escape it
+            if line.count(";") != separators or "\r" in line or "\n" in line:
+                raise csv.Error(f"need to escape, but no escapechar set: {line!r}")
+            lines.append(line)
+        lines.append("")  # trailing line terminator
+        self.csvfile.write("\r\n".join(lines))
+
+
+def csv_writer(csvfile, data, **kwargs):
+    loc = kwargs.pop("locale", DEFAULT_LSET_LOCALE)
+    date_format = kwargs.pop("date_format", DEFAULT_LSET_DATE_FORMAT) or (
+        DEFAULT_LSET_DATE_FORMAT
+    )
+
+    if date_format == DEFAULT_LSET_DATE_FORMAT:
+        fmt_date = _format_date_default
+    else:
+
+        def fmt_date(date: date) -> str:
+            return date.strftime(date_format)
+
+    encode_row = _make_row_encoder(fmt_date, loc)
+    return LsetwatchWriter(csvfile, data, encode_row)
 
 
 # Register custom CSV dialect
@@ -393,7 +759,16 @@ psv_codec_info = codecs.CodecInfo(
     psv_codec.decode,
     name=psv_codec.name,
 )
-codecs.register(
-    lambda encoding: bell_codec_info if encoding == bell_codec.name else None
-)
-codecs.register(lambda encoding: psv_codec_info if encoding == psv_codec.name else None)
+# A single registered search function; every codecs.lookup miss anywhere in
+# the process walks all registered functions, so keep it to one dict probe.
+_CODEC_MAP = {
+    bell_codec.name: bell_codec_info,
+    psv_codec.name: psv_codec_info,
+}
+codecs.register(_CODEC_MAP.get)
+
+# Direct bindings for internal hot paths; going through codecs.encode/decode
+# pays a registry lookup on every call
+_BELL_ENCODE = bell_codec.encode
+_BELL_DECODE = bell_codec.decode
+_PSV_ENCODE = psv_codec.encode
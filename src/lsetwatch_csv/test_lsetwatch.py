@@ -1,7 +1,7 @@
 import codecs
 import dataclasses
 import io
-from csv import Dialect, DictReader, register_dialect
+from csv import Dialect, DictReader, Error, register_dialect
 from datetime import date, datetime, timezone
 from enum import Enum, IntEnum
 from typing import Annotated, Optional
@@ -19,6 +19,8 @@ from lsetwatch_csv.lsetwatch import (
     LsetTemplate,
     LsetwatchRow,
     csv_reader,
+    csv_reader_fast,
+    csv_reader_parallel,
     csv_writer,
 )
 
@@ -83,6 +85,23 @@ def lsetwatch_csvfile_locale_de():
         yield file
 
 
+@pytest.fixture
+def lsetwatch_csvfile_binary():
+    # binary variant for readers operating on raw bytes; avoids
+    # locale-dependent decimal and date fields
+    lines = [
+        # header
+        "number;version;marker;color;template;mygroup;state;purc_condition;purc_platform;purc_person;purc_date;purc_number;purc_price;purc_shipc;purc_costs;purc_items;sell_condition;sell_platform;sell_person;sell_date;sell_number;sell_price;sell_shipc;sell_costs;sell_items;vip_points_get;vip_points_sub;cashback;cashback_type;location;addition;completeness;altern_pieces;packaging;instructions;sales_value;to_sell;notes;mytags;documents;reminder_date;last_edit",
+        # template: wishlist
+        "4496;1;;;2;;;;Wunschliste;;;;;;;1;;;;;;;;;1;;;;;;;;;;;;;;;;;1702113074",
+        # escape characters: quote and semicolon
+        "1;1;;;;category with semicolon \a59;;;;;;;;;;;;;;;;;;;1;;;;;;;;;;;;;note with \a34quote\a34 and diacritic ā;tag with pipe \a124|tag with semicolon \a59;;;1702113511",
+    ]
+    content = "\r\n".join(lines)
+    with io.BytesIO(content.encode("utf-8")) as file:
+        yield file
+
+
 @pytest.fixture
 def temp_file():
     with io.StringIO() as file:
@@ -101,6 +120,7 @@ def now():
         ('with \a34quote\a34 and diacritic ā"', 'with "quote" and diacritic ā"'),
         ("\a34\a59", '";'),
         ("\a124", "|"),
+        ("x\a300y", "xĬy"),
         ("", ""),
     ],
 )
@@ -168,6 +188,66 @@ def test_read_csv_dialect_dataclass(lsetwatch_csvfile):
     assert len(items) == 5
 
 
+def test_read_csv_raw_stream(tmp_path, lsetwatch_csvfile_binary):
+    path = tmp_path / "export.csv"
+    path.write_bytes(lsetwatch_csvfile_binary.getvalue())
+
+    with io.FileIO(path) as file:
+        items = [*csv_reader(file)]
+    assert len(items) == 2
+
+
+def test_read_escape_lazy(lsetwatch_csvfile_binary):
+    csvfile = io.StringIO(lsetwatch_csvfile_binary.getvalue().decode("utf-8"))
+    reader = csv_reader(csvfile)
+
+    item: LsetwatchRow = next(filter(lambda i: i.number == "1", reader))
+
+    # the encoded form is kept verbatim until first access
+    assert str(item.mygroup) == "category with semicolon \a59"
+    assert item.mygroup == "category with semicolon ;"
+    assert str(item.mytags) == "tag with pipe \a124|tag with semicolon \a59"
+    assert item.mytags == ["tag with pipe \a124", "tag with semicolon \a59"]
+
+
+def test_read_parallel(tmp_path, lsetwatch_csvfile_binary):
+    path = tmp_path / "export.csv"
+    path.write_bytes(lsetwatch_csvfile_binary.getvalue())
+
+    items = csv_reader_parallel(path, workers=2)
+    assert len(items) == 2
+
+    item = next(filter(lambda i: i.number == "1", items))
+    assert item.mygroup == "category with semicolon ;"
+    assert item.last_edit == datetime.fromtimestamp(1702113511, timezone.utc)
+
+
+def test_read_parallel_header_only(tmp_path, lsetwatch_csvfile_binary):
+    path = tmp_path / "export.csv"
+    header = lsetwatch_csvfile_binary.getvalue().split(b"\r\n")[0]
+    path.write_bytes(header + b"\r\n")
+
+    assert csv_reader_parallel(path, workers=2) == []
+
+
+def test_read_fast(lsetwatch_csvfile_binary):
+    pytest.importorskip("pyarrow.csv")
+
+    items = csv_reader_fast(lsetwatch_csvfile_binary)
+    assert len(items) == 2
+
+    item = next(filter(lambda i: i.number == "4496", items))
+    assert item.template == LsetTemplate.WUNSCHLISTE
+    assert item.purc_platform == "Wunschliste"
+    assert item.purc_items == 1
+    assert item.last_edit == datetime.fromtimestamp(1702113074, timezone.utc)
+
+    item = next(filter(lambda i: i.number == "1", items))
+    assert item.mygroup == "category with semicolon ;"
+    assert item.notes == 'note with "quote" and diacritic ā'
+    assert item.mytags == ["tag with pipe \a124", "tag with semicolon \a59"]
+
+
 def test_read_locale_nz(lsetwatch_csvfile_locale_nz):
     reader = csv_reader(
         lsetwatch_csvfile_locale_nz, date_format="%d/%m/%Y", locale="en_NZ.utf8"
@@ -441,6 +521,31 @@ def test_read_escape_list_observed(lsetwatch_csvfile_observed):
     ]
 
 
+def test_read_to_sell():
+    # both the documented 0/1 values and the "True"/"False" serialization of
+    # earlier exports are accepted
+    lines = [
+        "number;version;to_sell;last_edit",
+        "1;1;True;1702113074",
+        "2;1;1;1702113074",
+        "3;1;;1702113074",
+    ]
+    with io.StringIO("\r\n".join(lines)) as file:
+        items = [*csv_reader(file)]
+
+    assert [i.to_sell for i in items] == [True, True, None]
+
+
+def test_write_read_to_sell(temp_file, now):
+    items = [LsetwatchRow(last_edit=now, number="1", version="1", to_sell=True)]
+    writer = csv_writer(temp_file, items)
+    writer.write()
+
+    temp_file.seek(0)
+    item = next(csv_reader(temp_file))
+    assert item.to_sell is True
+
+
 def test_write_header(lsetwatch_csvfile, temp_file):
     writer = csv_writer(temp_file, [])
     writer.write()
@@ -490,6 +595,16 @@ def test_write_escape(temp_file, now):
     )
 
 
+def test_write_unescaped_delimiter(temp_file, now):
+    # purc_platform is not an escaped field, so a delimiter in it cannot be
+    # represented in the QUOTE_NONE dialect
+    items = [LsetwatchRow(last_edit=now, number="1", version="1", purc_platform="a;b")]
+    writer = csv_writer(temp_file, items)
+
+    with pytest.raises(Error, match="need to escape"):
+        writer.write()
+
+
 def test_write_locale_nz(temp_file, now):
     items = [
         LsetwatchRow(